@@ -3,7 +3,10 @@ from __future__ import annotations
 import argparse
 import importlib
 import pkgutil
+import queue
 import sys
+import threading
+import typing
 
 import terminaltexteffects.effects
 import terminaltexteffects.engine.terminal as term
@@ -11,6 +14,66 @@ from terminaltexteffects.engine.terminal import TerminalConfig
 from terminaltexteffects.utils.argsdataclass import ArgsDataClass
 
 
+def _print_frames(terminal: term.Terminal, frame_queue: queue.Queue, errors: list[BaseException]) -> None:
+    """Prints frames from the queue until a None sentinel is received. Runs on the output thread so the
+    next frames can be generated while the current frame is written to the terminal. Any exception raised
+    while printing ends the thread and is stored in errors so it can be re-raised on the main thread.
+
+    Args:
+        terminal (term.Terminal): Terminal to print the frames to.
+        frame_queue (queue.Queue): Queue of frames to print. A None value ends printing.
+        errors (list[BaseException]): List the exception raised while printing is appended to.
+    """
+    try:
+        for frame in iter(frame_queue.get, None):
+            terminal.print(frame)
+    except BaseException as e:
+        errors.append(e)
+
+
+def _put_frame(frame_queue: queue.Queue, frame: str | None, printer: threading.Thread) -> bool:
+    """Puts the frame on the queue, waiting for space only while the printer thread is alive.
+
+    Args:
+        frame_queue (queue.Queue): Queue of frames to print.
+        frame (str | None): Frame to put on the queue. None ends printing.
+        printer (threading.Thread): Thread consuming the queue.
+
+    Returns:
+        bool: True if the frame was queued, False if the printer thread stopped first.
+    """
+    while printer.is_alive():
+        try:
+            frame_queue.put(frame, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _output_frames(terminal: term.Terminal, frames: typing.Iterable[str]) -> None:
+    """Prints the frames on a separate output thread. Frame generation stops if the output thread stops, and
+    any exception raised while printing is re-raised.
+
+    Args:
+        terminal (term.Terminal): Terminal to print the frames to.
+        frames (typing.Iterable[str]): Frames to print.
+    """
+    frame_queue: queue.Queue[str | None] = queue.Queue(maxsize=2)
+    errors: list[BaseException] = []
+    printer = threading.Thread(target=_print_frames, args=(terminal, frame_queue, errors), daemon=True)
+    printer.start()
+    try:
+        for frame in frames:
+            if not _put_frame(frame_queue, frame, printer):
+                break
+    finally:
+        _put_frame(frame_queue, None, printer)
+        printer.join()
+    if errors:
+        raise errors[0]
+
+
 def main():
     parser = (argparse.ArgumentParser)(
         prog="tte",
@@ -69,8 +132,7 @@ def main():
         effect.terminal_config = terminal_config
         try:
             with effect.terminal_output() as terminal:
-                for frame in effect:
-                    terminal.print(frame)
+                _output_frames(terminal, effect)
         except KeyboardInterrupt:
             sys.exit(1)
 
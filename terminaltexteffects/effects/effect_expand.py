@@ -110,7 +110,6 @@ class ExpandIterator(BaseEffectIterator[ExpandConfig]):
     ):
         super().__init__(effect)
         self.pending_chars: list[EffectCharacter] = []
-        self.character_final_color_map: dict[EffectCharacter, Color] = {}
         self.build()
 
     def build(self) -> None:
@@ -118,27 +117,37 @@ class ExpandIterator(BaseEffectIterator[ExpandConfig]):
         final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
-        for character in self.terminal.get_characters():
-            self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
-        for character in self.terminal.get_characters():
-            character.motion.set_coordinate(self.terminal.canvas.center)
+        characters = self.terminal.get_characters()
+        # final colors are stored in the same order as the characters list
+        final_colors = [final_gradient_mapping[character.input_coord] for character in characters]
+        gradient_lut: dict[Color, Gradient] = {
+            color: Gradient(final_gradient.spectrum[0], color, steps=10)
+            for color in dict.fromkeys(final_gradient.spectrum)
+        }
+        canvas_center = self.terminal.canvas.center
+        movement_speed = self.config.movement_speed
+        expand_easing = self.config.expand_easing
+        final_gradient_frames = self.config.final_gradient_frames
+        for character, final_color in zip(characters, final_colors):
+            character.motion.set_coordinate(canvas_center)
             input_coord_path = character.motion.new_path(
-                speed=self.config.movement_speed,
-                ease=self.config.expand_easing,
+                speed=movement_speed,
+                ease=expand_easing,
+                layer=1,
             )
             input_coord_path.new_waypoint(character.input_coord)
             self.terminal.set_character_visibility(character, True)
             self.active_characters.append(character)
-            character.event_handler.register_event(
-                EventHandler.Event.PATH_ACTIVATED, input_coord_path, EventHandler.Action.SET_LAYER, 1
-            )
             character.event_handler.register_event(
                 EventHandler.Event.PATH_COMPLETE, input_coord_path, EventHandler.Action.SET_LAYER, 0
             )
             character.motion.activate_path(input_coord_path)
             gradient_scn = character.animation.new_scene()
-            gradient = Gradient(final_gradient.spectrum[0], self.character_final_color_map[character], steps=10)
-            gradient_scn.apply_gradient_to_symbols(gradient, character.input_symbol, self.config.final_gradient_frames)
+            gradient_scn.apply_gradient_to_symbols(
+                gradient_lut[final_color],
+                character.input_symbol,
+                final_gradient_frames,
+            )
             character.animation.activate_scene(gradient_scn)
 
     def __next__(self) -> str:
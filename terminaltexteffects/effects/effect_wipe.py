@@ -9,15 +9,31 @@ Classes:
 from __future__ import annotations
 
 import typing
+from collections import deque
 from dataclasses import dataclass
 
 import terminaltexteffects.utils.argvalidators as argvalidators
 from terminaltexteffects.engine.base_character import EffectCharacter
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
+from terminaltexteffects.engine.terminal import Terminal
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, argclass
 from terminaltexteffects.utils.graphics import Color, Gradient
 
 
+_WIPE_DIRECTION_GROUPING: dict[str, Terminal.CharacterGroup] = {
+    "column_left_to_right": Terminal.CharacterGroup.COLUMN_LEFT_TO_RIGHT,
+    "column_right_to_left": Terminal.CharacterGroup.COLUMN_RIGHT_TO_LEFT,
+    "row_top_to_bottom": Terminal.CharacterGroup.ROW_TOP_TO_BOTTOM,
+    "row_bottom_to_top": Terminal.CharacterGroup.ROW_BOTTOM_TO_TOP,
+    "diagonal_top_left_to_bottom_right": Terminal.CharacterGroup.DIAGONAL_TOP_LEFT_TO_BOTTOM_RIGHT,
+    "diagonal_bottom_left_to_top_right": Terminal.CharacterGroup.DIAGONAL_BOTTOM_LEFT_TO_TOP_RIGHT,
+    "diagonal_top_right_to_bottom_left": Terminal.CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT,
+    "diagonal_bottom_right_to_top_left": Terminal.CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT,
+    "center_to_outside": Terminal.CharacterGroup.CENTER_TO_OUTSIDE_DIAMONDS,
+    "outside_to_center": Terminal.CharacterGroup.OUTSIDE_TO_CENTER_DIAMONDS,
+}
+
+
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
     return Wipe, WipeConfig
 
@@ -124,8 +140,7 @@ class WipeConfig(ArgsDataClass):
 class WipeIterator(BaseEffectIterator[WipeConfig]):
     def __init__(self, effect: "Wipe") -> None:
         super().__init__(effect)
-        self.pending_groups: list[list[EffectCharacter]] = []
-        self.character_final_color_map: dict[EffectCharacter, Color] = {}
+        self.pending_groups: deque[list[EffectCharacter]] = deque()
         self.build()
 
     def build(self) -> None:
@@ -134,30 +149,18 @@ class WipeIterator(BaseEffectIterator[WipeConfig]):
         final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
-        for character in self.terminal.get_characters():
-            self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
-        sort_map = {
-            "column_left_to_right": self.terminal.CharacterGroup.COLUMN_LEFT_TO_RIGHT,
-            "column_right_to_left": self.terminal.CharacterGroup.COLUMN_RIGHT_TO_LEFT,
-            "row_top_to_bottom": self.terminal.CharacterGroup.ROW_TOP_TO_BOTTOM,
-            "row_bottom_to_top": self.terminal.CharacterGroup.ROW_BOTTOM_TO_TOP,
-            "diagonal_top_left_to_bottom_right": self.terminal.CharacterGroup.DIAGONAL_TOP_LEFT_TO_BOTTOM_RIGHT,
-            "diagonal_bottom_left_to_top_right": self.terminal.CharacterGroup.DIAGONAL_BOTTOM_LEFT_TO_TOP_RIGHT,
-            "diagonal_top_right_to_bottom_left": self.terminal.CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT,
-            "diagonal_bottom_right_to_top_left": self.terminal.CharacterGroup.DIAGONAL_BOTTOM_RIGHT_TO_TOP_LEFT,
-            "center_to_outside": self.terminal.CharacterGroup.CENTER_TO_OUTSIDE_DIAMONDS,
-            "outside_to_center": self.terminal.CharacterGroup.OUTSIDE_TO_CENTER_DIAMONDS,
+        gradient_lut: dict[Color, Gradient] = {
+            color: Gradient(final_gradient.spectrum[0], color, steps=self.config.final_gradient_steps)
+            for color in dict.fromkeys(final_gradient.spectrum)
         }
-        for group in self.terminal.get_characters_grouped(sort_map[direction]):
+        final_gradient_frames = self.config.final_gradient_frames
+        for group in self.terminal.get_characters_grouped(_WIPE_DIRECTION_GROUPING[direction]):
             for character in group:
                 wipe_scn = character.animation.new_scene()
-                wipe_gradient = Gradient(
-                    final_gradient.spectrum[0],
-                    self.character_final_color_map[character],
-                    steps=self.config.final_gradient_steps,
-                )
                 wipe_scn.apply_gradient_to_symbols(
-                    wipe_gradient, character.input_symbol, self.config.final_gradient_frames
+                    gradient_lut[final_gradient_mapping[character.input_coord]],
+                    character.input_symbol,
+                    final_gradient_frames,
                 )
                 character.animation.activate_scene(wipe_scn)
             self.pending_groups.append(group)
@@ -167,10 +170,10 @@ class WipeIterator(BaseEffectIterator[WipeConfig]):
         if self.pending_groups or self.active_characters:
             if not self._wipe_delay:
                 if self.pending_groups:
-                    next_group = self.pending_groups.pop(0)
+                    next_group = self.pending_groups.popleft()
                     for character in next_group:
                         self.terminal.set_character_visibility(character, True)
-                        self.active_characters.append(character)
+                    self.active_characters.extend(next_group)
                 self._wipe_delay = self.config.wipe_delay
             else:
                 self._wipe_delay -= 1
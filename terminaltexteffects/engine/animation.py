@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import random
 import typing
 from dataclasses import dataclass
@@ -71,25 +72,55 @@ class CharacterVisual:
 
     def format_symbol(self) -> str:
         """Formats the symbol for printing by applying ANSI sequences for any active modes and color."""
-        formatting_string = ""
-        if self.bold:
-            formatting_string += ansitools.APPLY_BOLD()
-        if self.italic:
-            formatting_string += ansitools.APPLY_ITALIC()
-        if self.underline:
-            formatting_string += ansitools.APPLY_UNDERLINE()
-        if self.blink:
-            formatting_string += ansitools.APPLY_BLINK()
-        if self.reverse:
-            formatting_string += ansitools.APPLY_REVERSE()
-        if self.hidden:
-            formatting_string += ansitools.APPLY_HIDDEN()
-        if self.strike:
-            formatting_string += ansitools.APPLY_STRIKETHROUGH()
-        if self._color_code is not None:
-            formatting_string += colorterm.fg(self._color_code)
-
-        return f"{formatting_string}{self.symbol}{ansitools.RESET_ALL() if formatting_string else ''}"
+        return _format_symbol(
+            self.symbol,
+            self.bold,
+            self.italic,
+            self.underline,
+            self.blink,
+            self.reverse,
+            self.hidden,
+            self.strike,
+            self._color_code,
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_symbol(
+    symbol: str,
+    bold: bool,
+    italic: bool,
+    underline: bool,
+    blink: bool,
+    reverse: bool,
+    hidden: bool,
+    strike: bool,
+    color_code: str | int | None,
+) -> str:
+    """Formats a symbol for printing by applying ANSI sequences for any active modes and color.
+
+    Characters sharing a symbol and final color produce identical frames, so the formatted result is cached and
+    reused across every CharacterVisual with the same symbol, modes, and color.
+    """
+    formatting_string = ""
+    if bold:
+        formatting_string += ansitools.APPLY_BOLD()
+    if italic:
+        formatting_string += ansitools.APPLY_ITALIC()
+    if underline:
+        formatting_string += ansitools.APPLY_UNDERLINE()
+    if blink:
+        formatting_string += ansitools.APPLY_BLINK()
+    if reverse:
+        formatting_string += ansitools.APPLY_REVERSE()
+    if hidden:
+        formatting_string += ansitools.APPLY_HIDDEN()
+    if strike:
+        formatting_string += ansitools.APPLY_STRIKETHROUGH()
+    if color_code is not None:
+        formatting_string += colorterm.fg(color_code)
+
+    return f"{formatting_string}{symbol}{ansitools.RESET_ALL() if formatting_string else ''}"
 
 
 @dataclass
@@ -177,6 +208,8 @@ class Scene:
         self.frame_index_map: dict[int, Frame] = {}
         self.easing_total_steps: int = 0
         self.easing_current_step: int = 0
+        self._eased_steps: tuple[float, ...] = ()
+        self._eased_steps_func: easing.EasingFunction | None = None
 
     def add_frame(
         self,
@@ -562,8 +595,12 @@ class Animation:
 
         if self.active_scene is None:
             return 0
-        elapsed_step_ratio = self.active_scene.easing_current_step / self.active_scene.easing_total_steps
-        return easing_func(elapsed_step_ratio)
+        scene = self.active_scene
+        if scene._eased_steps_func is not easing_func or len(scene._eased_steps) != scene.easing_total_steps + 1:
+            scene._eased_steps = easing.eased_steps(easing_func, scene.easing_total_steps)
+            scene._eased_steps_func = easing_func
+        # a finished scene that is activated again keeps its step count, so hold it at the final step
+        return scene._eased_steps[min(scene.easing_current_step, scene.easing_total_steps)]
 
     def step_animation(self) -> None:
         """Progresses the Scene and applies the next visual to the character. If the active scene is complete, a SCENE_COMPLETE event is triggered."""
@@ -17,6 +17,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from copy import deepcopy
+from operator import attrgetter
 from typing import Generator, Generic, TypeVar
 
 from terminaltexteffects.engine.base_character import EffectCharacter
@@ -25,6 +26,8 @@ from terminaltexteffects.utils.argsdataclass import ArgsDataClass
 
 T = TypeVar("T", bound=ArgsDataClass)
 
+_is_active = attrgetter("is_active")
+
 
 class BaseEffectIterator(ABC, Generic[T]):
     """Base iterator class for all effects.
@@ -67,9 +70,11 @@ class BaseEffectIterator(ABC, Generic[T]):
 
     def update(self) -> None:
         """Run the tick method for all active characters and remove inactive characters from the active list."""
-        for character in self.active_characters:
+        active_characters = self.active_characters
+        for character in active_characters:
             character.tick()
-        self.active_characters = [character for character in self.active_characters if character.is_active]
+        # compact in place so the same list object is kept for the life of the iterator
+        active_characters[:] = filter(_is_active, active_characters)
 
     def __iter__(self) -> "BaseEffectIterator":
         return self
@@ -138,6 +138,8 @@ class Path:
         self.hold_time_remaining = self.hold_time
         self.last_distance_reached: float = 0  # used for animation syncing to distance
         self.origin_segment: Segment | None = None
+        self._eased_distance_factors: tuple[float, ...] | None = None
+        self._eased_distance_factors_ease: easing.EasingFunction | None = None
         if self.speed <= 0:
             raise ValueError(f"({self.speed=}) Speed must be greater than 0.")
 
@@ -222,15 +224,22 @@ class Path:
         Returns:
             Coord: The next coordinate on the path.
         """
-        if not self.max_steps or self.current_step >= self.max_steps or not self.total_distance:
+        max_steps = self.max_steps
+        if not max_steps or self.current_step >= max_steps or not self.total_distance:
             # if the path has zero distance or there are no more steps, return the coordinate of the final waypoint in the path
             return self.segments[-1].end.coord
-        else:
-            self.current_step += 1
+        self.current_step += 1
         if self.ease:
-            distance_factor = self.ease(self.current_step / self.max_steps)
+            if (
+                self._eased_distance_factors is None
+                or self._eased_distance_factors_ease is not self.ease
+                or len(self._eased_distance_factors) != max_steps + 1
+            ):
+                self._eased_distance_factors = easing.eased_steps(self.ease, max_steps)
+                self._eased_distance_factors_ease = self.ease
+            distance_factor = self._eased_distance_factors[self.current_step]
         else:
-            distance_factor = self.current_step / self.max_steps
+            distance_factor = self.current_step / max_steps
 
         distance_to_travel = distance_factor * self.total_distance
         self.last_distance_reached = distance_to_travel
@@ -471,6 +480,7 @@ class Motion:
         self.active_path.current_step = 0
         self.active_path.hold_time_remaining = self.active_path.hold_time
         self.active_path.max_steps = round(self.active_path.total_distance / self.active_path.speed)
+        self.active_path._eased_distance_factors = None
         for segment in self.active_path.segments:
             segment.enter_event_triggered = False
             segment.exit_event_triggered = False
@@ -504,8 +514,9 @@ class Motion:
 
         The character's previous coordinate is preserved before moving to allow for clearing the location in the terminal.
         """
-        # preserve previous coordinate to allow for clearing the location in the terminal
-        self.previous_coord = Coord(self.current_coord.column, self.current_coord.row)
+        # preserve previous coordinate to allow for clearing the location in the terminal. Coords are immutable,
+        # so the current coordinate can be referenced directly rather than copied.
+        self.previous_coord = self.current_coord
 
         if not self.active_path or not self.active_path.segments:
             return
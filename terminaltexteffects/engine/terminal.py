@@ -821,8 +821,8 @@ class Terminal:
         """
         if enforce_frame_rate:
             self.enforce_framerate()
-        self.move_cursor_to_top()
-        sys.stdout.write(output_string)
+        # the cursor movement and the frame are written together so each frame is a single write to stdout
+        sys.stdout.write(self._cursor_to_top_sequence() + output_string)
         sys.stdout.flush()
 
     def enforce_framerate(self):
@@ -834,7 +834,14 @@ class Terminal:
             time.sleep(frame_delay - time_since_last_print)
         self._last_time_printed = time.time()
 
+    def _cursor_to_top_sequence(self) -> str:
+        """Returns the ANSI sequence that restores the cursor position to the top of the canvas.
+
+        Returns:
+            str: The cursor movement sequence.
+        """
+        return ansitools.DEC_RESTORE_CURSOR_POSITION() + ansitools.MOVE_CURSOR_UP(self.visible_top)
+
     def move_cursor_to_top(self):
         """Restores the cursor position to the top of the canvas."""
-        sys.stdout.write(ansitools.DEC_RESTORE_CURSOR_POSITION())
-        sys.stdout.write(ansitools.MOVE_CURSOR_UP(self.visible_top))
+        sys.stdout.write(self._cursor_to_top_sequence())
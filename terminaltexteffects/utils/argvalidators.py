@@ -453,7 +453,7 @@ class Ease:
     METAVAR = "(Easing Function)"
 
     @staticmethod
-    def type_parser(arg: str) -> typing.Callable:
+    def type_parser(arg: str) -> easing.EasingFunction:
         """Validates that the given argument is a valid easing function.
 
         Args:
@@ -463,7 +463,7 @@ class Ease:
             argparse.ArgumentTypeError: Ease value is not a valid easing function.
 
         Returns:
-            Ease: validated ease value
+            easing.EasingFunction: validated easing function
         """
         easing_func_map = {
             "linear": easing.linear,
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 
 def _hex_to_int(hex_color: str) -> tuple[int, int, int]:
     """Converts a hex color string into a list of integers.
@@ -17,9 +19,12 @@ def _hex_to_int(hex_color: str) -> tuple[int, int, int]:
     return ints[0], ints[1], ints[2]
 
 
+@functools.lru_cache(maxsize=1024)
 def _color(color_code: str | int, location: int) -> str:
     """Returns an ANSI escape sequence to color the foreground/background of text. This is a helper function for fg() and bg().
 
+    Sequences are cached, as effects request the same handful of gradient colors for every character.
+
     Args:
         color_code (str | int): The color code to be converted.
         location (int): The location to apply the color.
@@ -32,16 +32,24 @@ Functions:
     in_bounce: Ease in using a bounce function.
     out_bounce: Ease out using a bounce function.
     in_out_bounce: Ease in/out using a bounce function.
+    eased_steps: Returns the eased value for every step of an easing function divided into a number of steps.
 """
 
 from __future__ import annotations
 
+import functools
 import math
 import typing
 
-# EasingFunction is a type alias for a function that takes a float between 0 and 1 and returns a float between 0 and 1.
-EasingFunction = typing.Callable[[float], float]
-"EasingFunctions are Callable[[float], float] functions that take a float between 0 and 1 and return a float between 0 and 1."
+
+class EasingFunction(typing.Protocol):
+    """EasingFunctions are Callable[[float], float] functions that take a float between 0 and 1 and return a float between 0 and 1.
+
+    EasingFunctions must be hashable, as the eased values for a function are cached by eased_steps."""
+
+    def __call__(self, progress_ratio: float, /) -> float: ...
+
+    def __hash__(self) -> int: ...
 
 
 def linear(progress_ratio: float) -> float:
@@ -521,3 +529,21 @@ def in_out_bounce(progress_ratio: float) -> float:
         return (1 - out_bounce(1 - 2 * progress_ratio)) / 2
     else:
         return (1 + out_bounce(2 * progress_ratio - 1)) / 2
+
+
+@functools.lru_cache(maxsize=1024)
+def eased_steps(easing_func: EasingFunction, total_steps: int) -> tuple[float, ...]:
+    """
+    Returns the eased value for every step of an easing function divided into a number of steps.
+
+    Many characters share an easing function and step count, so the result is cached and each easing function is
+    evaluated once per step rather than once per step for every character.
+
+    Args:
+        easing_func (EasingFunction): the easing function to evaluate
+        total_steps (int): the number of steps, total_steps > 0
+
+    Returns:
+        tuple[float, ...]: (length=total_steps + 1) eased values where index n is easing_func(n / total_steps)
+    """
+    return tuple(easing_func(step / total_steps) for step in range(total_steps + 1))
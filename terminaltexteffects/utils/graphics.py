@@ -209,13 +209,11 @@ class Gradient:
             start, end = color_pair
             start_color_ints = start.rgb_ints
             end_color_ints = end.rgb_ints
-            # Initialize an empty list to store the gradient colors
-            gradient_colors: list[Color] = []
             # Calculate the color deltas for each RGB value
             red_delta = (end_color_ints[0] - start_color_ints[0]) // steps
             green_delta = (end_color_ints[1] - start_color_ints[1]) // steps
             blue_delta = (end_color_ints[2] - start_color_ints[2]) // steps
-            # Calculate the intermediate colors and add them to the gradient colors list
+            # Calculate the intermediate colors and add them directly to the spectrum
             range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
             for i in range(range_start, max(steps, 0)):
                 red = start_color_ints[0] + (red_delta * i)
@@ -227,11 +225,10 @@ class Gradient:
                 green = max(0, min(green, 255))
                 blue = max(0, min(blue, 255))
 
-                # Convert the RGB values to a hex color string and add it to the gradient colors list
-                gradient_colors.append(Color(f"{red:02x}{green:02x}{blue:02x}"))
-            # Add the end color to the gradient colors list
-            gradient_colors.append(end)
-            spectrum.extend(gradient_colors)
+                # Convert the RGB values to a hex color string and add it to the spectrum
+                spectrum.append(Color(f"{red:02x}{green:02x}{blue:02x}"))
+            # Add the end color to the spectrum
+            spectrum.append(end)
         return spectrum
 
     def build_coordinate_color_mapping(
@@ -277,13 +274,18 @@ class Gradient:
                     color = self.get_color_at_fraction(distance_from_center)
                     gradient_mapping[geometry.Coord(column_value, row_value)] = color
         elif direction == Gradient.Direction.DIAGONAL:
+            # coordinates on the same diagonal share a color, so the colors are looked up by diagonal index
+            diagonal_span = (max_row * 2) + max_column
+            if max_row == 0 or max_column == 0:
+                diagonal_colors = [self.get_color_at_fraction(1.0)] * (diagonal_span + 1)
+            else:
+                diagonal_colors = [
+                    self.get_color_at_fraction(diagonal_index / diagonal_span)
+                    for diagonal_index in range(diagonal_span + 1)
+                ]
             for row_value in range(max_row + 1):
                 for column_value in range(1, max_column + 1):
-                    if max_row == 0 or max_column == 0:
-                        fraction = 1.0
-                    else:
-                        fraction = ((row_value * 2) + column_value) / ((max_row * 2) + max_column)
-                    color = self.get_color_at_fraction(fraction)
+                    color = diagonal_colors[(row_value * 2) + column_value]
                     gradient_mapping[geometry.Coord(column_value, row_value)] = color
 
         return gradient_mapping
@@ -157,3 +157,28 @@ def test_animation_non_looping_active_scene_is_complete(character):
     assert animation.active_scene_is_complete() is False
     animation.step_animation()
     assert animation.active_scene_is_complete() is True
+
+
+def test_animation_ease_animation_matches_easing_function(character):
+    animation = character.animation
+    scene = animation.new_scene(id="test_scene", ease=easing.in_out_quart)
+    for symbol in "abcde":
+        scene.add_frame(symbol=symbol, duration=2)
+    animation.activate_scene(scene)
+    for step in range(scene.easing_total_steps):
+        assert animation._ease_animation(easing.in_out_quart) == easing.in_out_quart(step / scene.easing_total_steps)
+        animation.step_animation()
+
+
+def test_animation_eased_scene_can_be_activated_again_after_completion(character):
+    animation = character.animation
+    scene = animation.new_scene(id="test_scene", ease=easing.in_sine)
+    for symbol in "abc":
+        scene.add_frame(symbol=symbol, duration=1)
+    animation.activate_scene(scene)
+    while not animation.active_scene_is_complete():
+        animation.step_animation()
+    animation.activate_scene(scene)
+    animation.step_animation()
+    animation.step_animation()
+    assert animation.current_character_visual.symbol == "c"
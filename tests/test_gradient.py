@@ -1,3 +1,4 @@
+from terminaltexteffects.utils.geometry import Coord
 from terminaltexteffects.utils.graphics import Color, Gradient
 
 
@@ -44,3 +45,11 @@ def test_gradient_single_step() -> None:
 def test_gradient_three_colors() -> None:
     g = Gradient(Color("ffffff"), Color("000000"), Color("ffffff"), steps=4)
     assert g.spectrum[0] == Color("ffffff") and g.spectrum[4] == Color("000000") and g.spectrum[-1] == Color("ffffff")
+
+
+def test_gradient_diagonal_coordinate_color_mapping() -> None:
+    g = Gradient(Color("000000"), Color("ffffff"), steps=6)
+    mapping = g.build_coordinate_color_mapping(2, 4, Gradient.Direction.DIAGONAL)
+    assert mapping[Coord(4, 2)] == g.spectrum[-1]
+    for coord, color in mapping.items():
+        assert color == g.get_color_at_fraction(((coord.row * 2) + coord.column) / 8)
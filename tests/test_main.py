@@ -0,0 +1,43 @@
+import pytest
+
+from terminaltexteffects.__main__ import _output_frames
+
+
+class BrokenPipeTerminal:
+    def __init__(self) -> None:
+        self.printed_frames: list[str] = []
+
+    def print(self, output_string: str) -> None:
+        self.printed_frames.append(output_string)
+        if len(self.printed_frames) == 2:
+            raise BrokenPipeError
+
+
+class RecordingTerminal:
+    def __init__(self) -> None:
+        self.printed_frames: list[str] = []
+
+    def print(self, output_string: str) -> None:
+        self.printed_frames.append(output_string)
+
+
+def test_output_frames_prints_all_frames():
+    terminal = RecordingTerminal()
+    frames = [str(i) for i in range(10)]
+    _output_frames(terminal, frames)
+    assert terminal.printed_frames == frames
+
+
+def test_output_frames_reraises_printer_error_and_stops_generating_frames():
+    terminal = BrokenPipeTerminal()
+    generated_frames: list[str] = []
+
+    def frames():
+        for i in range(1000):
+            generated_frames.append(str(i))
+            yield str(i)
+
+    with pytest.raises(BrokenPipeError):
+        _output_frames(terminal, frames())
+    assert terminal.printed_frames == ["0", "1"]
+    assert len(generated_frames) < 1000